@@ -1,5 +1,4 @@
-from pymongo import MongoClient
-from src.config import MONGODB_URI
+from src.persistence import get_client
 
 
 def main():
@@ -8,12 +7,15 @@ def main():
     This function can be used as an entry point for your application.
     """
     print("===== Starting MongoDB Service Template =====")
-    client = MongoClient(MONGODB_URI)
+    client = get_client()
     db = client["playground"]
     testCollection = db["test"]
+    # Idempotent: backs the lookup by name below instead of a collection scan
+    testCollection.create_index("name")
     testCollection.insert_one({"name": "John", "age": 30})
-    cursor = testCollection.find({"name": "John"})
-    print(list(cursor))
+    # Stream documents as batches arrive; the result grows by one per run
+    for document in testCollection.find({"name": "John"}):
+        print(document)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import atexit
+import threading
+from pymongo import MongoClient
+from src.config import MONGODB_URI
+
+_client = None
+_client_lock = threading.Lock()
+_close_registered = False
+
+
+def get_client():
+    """
+    Returns the process-wide MongoClient, creating it on first use.
+    MongoClient is thread-safe and owns its connection pool, so it should be
+    shared rather than constructed per call. Creation is guarded by a lock so
+    concurrent first calls cannot each build (and leak) a client.
+    """
+    global _client, _close_registered
+    if _client is None:
+        with _client_lock:
+            # Re-check: another thread may have created it while we waited
+            if _client is None:
+                _client = MongoClient(
+                    MONGODB_URI,
+                    # The server picks the first compressor it also supports
+                    compressors="zstd,zlib",
+                    # The driver already enables TCP keepalive with a 120 s idle
+                    # time; socketTimeoutMS is what bounds a stalled read. It
+                    # also fails any legitimate operation running longer than
+                    # 20 s, such as an index build on a large collection.
+                    socketTimeoutMS=20000,
+                    waitQueueTimeoutMS=10000,
+                    appname="mongodb-service-template",
+                )
+                if not _close_registered:
+                    atexit.register(close_client)
+                    _close_registered = True
+    return _client
+
+
+def close_client():
+    """
+    Closes the shared MongoClient, if one was created.
+    A later call to get_client will create a new one.
+    """
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
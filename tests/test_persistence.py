@@ -0,0 +1,25 @@
+import pytest
+from src.persistence import close_client, get_client
+
+
+def test_get_client_returns_singleton():
+    """Tests that get_client reuses a single MongoClient."""
+    assert get_client() is get_client()
+
+
+def test_close_client_resets_singleton():
+    """Tests that close_client drops the shared MongoClient."""
+    client = get_client()
+    close_client()
+    assert get_client() is not client
+    close_client()
+
+
+def test_get_client_options():
+    """Tests the connection options set on the shared MongoClient."""
+    pool_options = get_client().options.pool_options
+    assert pool_options._compression_settings.compressors == ["zstd", "zlib"]
+    assert pool_options.socket_timeout == 20.0
+    assert pool_options.wait_queue_timeout == 10.0
+    assert pool_options.appname == "mongodb-service-template"
+    close_client()